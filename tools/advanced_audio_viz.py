@@ -11,21 +11,41 @@ Provides comprehensive 3D visualization capabilities including:
 import sys
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.widgets import Slider, Button
-from mpl_toolkits.mplot3d import Axes3D
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import plotly.offline as pyo
 from scipy import signal
-from scipy.fft import fft, fftfreq
+from scipy.fft import rfft, rfftfreq, set_workers
 import threading
 import time
+import functools
 from pathlib import Path
-import tkinter as tk
-from tkinter import filedialog, messagebox
-import pygame
-from collections import deque
+
+# Heavy GUI/plotting dependencies (plotly, tkinter, pygame, mplot3d) are
+# imported lazily inside the functions that need them so CLI exports and
+# cold starts do not pay for the whole stack up front.
+
+# Optional fused |X| -> dB kernel. With numba the abs, add and log10 run
+# as one parallel memory pass instead of three full-size temporaries;
+# without it we fall back to the plain NumPy expression.
+try:
+    import math
+    from numba import njit, prange
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _abs_db_kernel(X, out):
+        for i in prange(X.shape[0]):
+            for j in range(X.shape[1]):
+                v = X[i, j].real * X[i, j].real + X[i, j].imag * X[i, j].imag
+                out[i, j] = 10.0 * math.log10(v + 1e-20)
+
+    def _mag_db(X):
+        """Return 20*log10(|X| + 1e-10) as float32 for a complex array."""
+        X2 = X.reshape(1, -1) if X.ndim == 1 else X
+        out = np.empty(X2.shape, np.float32)
+        _abs_db_kernel(X2, out)
+        return out.reshape(X.shape)
+except ImportError:
+    def _mag_db(X):
+        """Return 20*log10(|X| + 1e-10) as float32 for a complex array."""
+        return (20 * np.log10(np.abs(X) + 1e-10)).astype(np.float32, copy=False)
 
 # Import audio loading functions from sound_ball.py
 try:
@@ -42,27 +62,72 @@ except ImportError:
         except Exception as e:
             raise RuntimeError(f"Could not load audio: {e}")
 
+# Spectrograms above this many bytes are spilled to an on-disk memmap
+_SPEC_MEMMAP_BYTES = 256 * 1024 * 1024
+
+# Optional numexpr backend for the real-valued dB conversion: fuses the
+# add, log10 and scale into one SIMD + threaded pass with no temporaries
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+def _db_from_mag(x):
+    """Return 20*log10(x + 1e-10) as float32 for a real magnitude array."""
+    if ne is not None:
+        x = np.asarray(x, dtype=np.float32)
+        # float32 constants keep numexpr in single precision; bare
+        # literals are float64 and would promote the whole result
+        scale = np.float32(20)
+        eps = np.float32(1e-10)
+        return ne.evaluate('scale*log10(x + eps)')
+    return (20 * np.log10(x + 1e-10)).astype(np.float32, copy=False)
+
+@functools.lru_cache(maxsize=8)
+def _hann(n):
+    """Hann window of length n, cached as float32 (few distinct sizes)."""
+    return np.hanning(n).astype(np.float32)
+
+def _batched_dominant_freqs(y, sr, win=4096, hop=2048, fmin=30, fmax=6000):
+    """Dominant frequency per frame via one batched rfft over a framed view.
+
+    Fallback for when the spectrogram-derived series is not available;
+    the strided view avoids copying the audio into per-frame chunks.
+    """
+    if len(y) < win:
+        return np.array([0.0], dtype=np.float32)
+    frames = np.lib.stride_tricks.sliding_window_view(y, win)[::hop]
+    X = rfft(frames * _hann(win), axis=1, workers=-1)
+    freq_bins = rfftfreq(win, 1/sr)
+    lo = int(np.searchsorted(freq_bins, fmin))
+    hi = int(np.searchsorted(freq_bins, fmax, side='right'))
+    peaks = np.argmax(np.abs(X[:, lo:hi]), axis=1)
+    return freq_bins[lo + peaks].astype(np.float32)
+
 class Advanced3DAudioVisualizer:
     """Advanced 3D Audio Visualization System"""
     
     def __init__(self):
         self.audio_data = None
         self.sample_rate = None
+        self.duration = None
+        self.n_samples = None
         self.frequencies = None
         self.times = None
         self.spectrogram = None
         self.current_position = 0
+        self._time_axis_ms = None
+        self._dominant_freqs = None
         self.is_playing = False
         self.audio_player = None
-        self.waterfall_data = deque(maxlen=100)  # Store last 100 frames
-        
-        # Initialize pygame for audio playback
-        pygame.mixer.init()
-        
+        # pygame's mixer is initialized lazily on first playback so that
+        # analysis/export-only runs never open an audio device
+
     def load_audio_file(self, file_path):
         """Load audio file and prepare for visualization"""
         try:
             self.audio_data, self.sample_rate = load_audio_mono(file_path)
+            self._time_axis_ms = None
             print(f"Loaded audio: {len(self.audio_data)} samples at {self.sample_rate} Hz")
             self._prepare_analysis_data()
             return True
@@ -70,29 +135,115 @@ class Advanced3DAudioVisualizer:
             print(f"Error loading audio: {e}")
             return False
     
+    def load_audio_array(self, audio_data, sample_rate):
+        """Load already-decoded samples, skipping the on-disk decode.
+
+        Fast path for callers that hold the PCM data in memory (e.g. a
+        memory-mapped WAV): integer PCM is normalized to float32 and
+        stereo is averaged down to mono, then the usual analysis runs.
+        """
+        try:
+            y = np.asarray(audio_data)
+            src_dtype = y.dtype
+            if y.ndim > 1:
+                y = y.mean(axis=1)
+            if np.issubdtype(src_dtype, np.integer):
+                y = y.astype(np.float32) / np.float32(np.iinfo(src_dtype).max)
+            self.audio_data = y.astype(np.float32, copy=False)
+            self.sample_rate = sample_rate
+            self._time_axis_ms = None
+            print(f"Loaded audio: {len(self.audio_data)} samples at {sample_rate} Hz")
+            self._prepare_analysis_data()
+            return True
+        except Exception as e:
+            print(f"Error loading audio: {e}")
+            return False
+
     def _prepare_analysis_data(self):
         """Prepare frequency and time analysis data"""
         if self.audio_data is None:
             return
-            
+
+        # Cache sample count and duration once so downstream time-axis
+        # builds never re-derive them from the array
+        self.n_samples = self.audio_data.shape[0]
+        self.duration = self.n_samples / self.sample_rate
+
         # Calculate spectrogram
         window_size = 2048
         hop_length = 512
-        
-        self.frequencies, self.times, self.spectrogram = signal.spectrogram(
-            self.audio_data, 
-            self.sample_rate,
-            window='hann',
-            nperseg=window_size,
-            noverlap=window_size - hop_length
-        )
-        
-        # Convert to dB scale
-        self.spectrogram = 20 * np.log10(self.spectrogram + 1e-10)
+
+        # Keep the analysis in float32: halves memory bandwidth with no
+        # visible precision loss, and let the FFT backend use all cores
+        self.audio_data = self.audio_data.astype(np.float32, copy=False)
+        # detrend=False skips a full-size detrend copy and mode='magnitude'
+        # avoids the PSD scaling pass we would only undo for the dB plot
+        with set_workers(-1):
+            self.frequencies, self.times, self.spectrogram = signal.spectrogram(
+                self.audio_data,
+                self.sample_rate,
+                window='hann',
+                nperseg=window_size,
+                noverlap=window_size - hop_length,
+                detrend=False,
+                return_onesided=True,
+                mode='magnitude',
+                scaling='spectrum'
+            )
+
+        # Convert to dB scale (float32, avoids a full-size float64 copy).
+        # Spectrograms whose dB copy would be very large are spilled to a
+        # float16 memory map instead, so peak RSS stays bounded and the
+        # downsampled plotting slices only page in the rows they touch.
+        Sxx = self.spectrogram
+        if Sxx.nbytes * 2 > _SPEC_MEMMAP_BYTES:
+            import os
+            import tempfile
+            spec_path = Path(tempfile.gettempdir()) / f"sonar_spec_{os.getpid()}.npy"
+            mm = np.lib.format.open_memmap(
+                str(spec_path), mode='w+', dtype=np.float16, shape=Sxx.shape)
+            row_step = max(1, (1 << 24) // max(1, Sxx.shape[1]))
+            for r in range(0, Sxx.shape[0], row_step):
+                mm[r:r + row_step] = _db_from_mag(Sxx[r:r + row_step])
+            self.spectrogram = mm
+        else:
+            self.spectrogram = _db_from_mag(Sxx)
+        self.frequencies = self.frequencies.astype(np.float32, copy=False)
+        self.times = self.times.astype(np.float32, copy=False)
+
+        # Dominant frequency per frame comes free from the spectrogram:
+        # a single argmax pass instead of a second STFT later on.
+        # Band-limit to 30-6000 Hz like dominant_freq_series did, so DC
+        # offsets and sub-audible rumble (no longer removed now that
+        # detrend=False) cannot pin the series at 0 Hz.
+        lo = int(np.searchsorted(self.frequencies, 30.0))
+        hi = int(np.searchsorted(self.frequencies, 6000.0, side='right'))
+        if hi <= lo:
+            lo, hi = 0, len(self.frequencies)
+        self._dominant_freqs = self.frequencies[
+            lo + np.argmax(self.spectrogram[lo:hi], axis=0)]
         
         print(f"Spectrogram shape: {self.spectrogram.shape}")
         print(f"Frequency range: {self.frequencies[0]:.1f} - {self.frequencies[-1]:.1f} Hz")
         print(f"Time range: {self.times[0]*1000:.1f} - {self.times[-1]*1000:.1f} ms")
+
+    def unload_timeseries(self):
+        """Drop the raw audio buffer once only derived data is needed.
+
+        Batch/CLI callers can release the full time series (tens of MB for
+        long files) after all figures are built; the cached spectrogram and
+        dominant-frequency series stay available. Playback needs a reload.
+        """
+        self.audio_data = None
+        self._time_axis_ms = None
+
+    @property
+    def time_axis_ms(self):
+        """Waveform time axis in milliseconds, built once and cached."""
+        if self._time_axis_ms is None:
+            self._time_axis_ms = np.arange(
+                len(self.audio_data), dtype=np.float32) * (1000.0 / self.sample_rate)
+        return self._time_axis_ms
     
     def create_3d_frequency_landscape(self, interactive=True):
         """Create 3D frequency landscape visualization
@@ -107,24 +258,32 @@ class Advanced3DAudioVisualizer:
         else:
             return self._create_matplotlib_3d_landscape()
     
+    def _landscape_data(self, max_freq_rows, max_time_cols):
+        """Downsampled (frequencies, times, spectrogram) for the 3D
+        landscape, shared by the plotly and matplotlib builders."""
+        if (self.spectrogram.shape[0] <= max_freq_rows
+                and self.spectrogram.shape[1] <= max_time_cols):
+            return self.frequencies, self.times, self.spectrogram
+        freq_step = max(1, len(self.frequencies) // max_freq_rows)
+        time_step = max(1, len(self.times) // max_time_cols)
+        return (self.frequencies[::freq_step],
+                self.times[::time_step],
+                self.spectrogram[::freq_step, ::time_step])
+
     def _create_plotly_3d_landscape(self):
         """Create interactive 3D landscape using Plotly"""
-        # Downsample for performance
-        freq_step = max(1, len(self.frequencies) // 100)
-        time_step = max(1, len(self.times) // 200)
-        
-        freq_subset = self.frequencies[::freq_step]
-        time_subset = self.times[::time_step]
-        spec_subset = self.spectrogram[::freq_step, ::time_step]
-        
-        # Create meshgrid
-        T, F = np.meshgrid(time_subset, freq_subset)
-        
-        # Create 3D surface plot
+        import plotly.graph_objects as go
+
+        # Downsample for performance, but only when actually large
+        freq_subset, time_subset, spec_subset = self._landscape_data(100, 200)
+
+        # Strided slices are non-contiguous and would be recopied during
+        # JSON serialization; make the payload contiguous once. Surface
+        # accepts 1-D axes, so no meshgrid needs to be materialized.
         fig = go.Figure(data=[go.Surface(
-            x=T*1000,
-            y=F, 
-            z=spec_subset,
+            x=np.ascontiguousarray(time_subset * 1000, dtype=np.float32),
+            y=np.ascontiguousarray(freq_subset, dtype=np.float32),
+            z=np.ascontiguousarray(spec_subset, dtype=np.float16),
             colorscale='Viridis',
             colorbar=dict(title="Amplitude (dB)"),
             hovertemplate='Time: %{x:.1f}ms<br>Frequency: %{y:.1f}Hz<br>Amplitude: %{z:.1f}dB<extra></extra>'
@@ -148,17 +307,14 @@ class Advanced3DAudioVisualizer:
     
     def _create_matplotlib_3d_landscape(self):
         """Create 3D landscape using Matplotlib"""
+        from mpl_toolkits.mplot3d import Axes3D  # noqa: F401 (registers 3d projection)
+
         fig = plt.figure(figsize=(12, 8))
         ax = fig.add_subplot(111, projection='3d')
         
         # Downsample for performance
-        freq_step = max(1, len(self.frequencies) // 50)
-        time_step = max(1, len(self.times) // 100)
-        
-        freq_subset = self.frequencies[::freq_step]
-        time_subset = self.times[::time_step]
-        spec_subset = self.spectrogram[::freq_step, ::time_step]
-        
+        freq_subset, time_subset, spec_subset = self._landscape_data(50, 100)
+
         # Create meshgrid
         T, F = np.meshgrid(time_subset, freq_subset)
         
@@ -184,7 +340,10 @@ class Advanced3DAudioVisualizer:
         if self.spectrogram is None:
             print("No audio data loaded")
             return None
-            
+
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+
         # Create subplots
         fig = make_subplots(
             rows=3, cols=1,
@@ -195,31 +354,42 @@ class Advanced3DAudioVisualizer:
                    [{"secondary_y": False}]]
         )
         
-        # Time axis for waveform (in milliseconds)
-        time_axis = np.linspace(0, len(self.audio_data) / self.sample_rate * 1000, len(self.audio_data))
-        
-        # Add waveform
+        # Add waveform: a uniform x axis is described by x0/dx instead of
+        # materializing an N-float time array, and the trace is strided
+        # down to roughly screen resolution
+        stride = max(1, len(self.audio_data) // 20000)
         fig.add_trace(
-            go.Scatter(x=time_axis, y=self.audio_data, 
+            go.Scattergl(x0=0, dx=stride * 1000.0 / self.sample_rate,
+                      y=self.audio_data[::stride],
                       mode='lines', name='Waveform',
                       line=dict(color='blue', width=1)),
             row=1, col=1
         )
-        
-        # Add spectrogram
+
+        # Add spectrogram, downsampled to display resolution before it is
+        # serialized into the HTML payload
+        fstep = max(1, len(self.frequencies) // 512)
+        tstep = max(1, len(self.times) // 2000)
         fig.add_trace(
-            go.Heatmap(x=self.times*1000, y=self.frequencies, z=self.spectrogram,
-                      colorscale='Viridis', name='Spectrogram',
+            go.Heatmap(x=self.times[::tstep]*1000, y=self.frequencies[::fstep],
+                      z=self.spectrogram[::fstep, ::tstep],
+                      colorscale='Viridis', name='Spectrogram', zsmooth=False,
                       hovertemplate='Time: %{x:.1f}ms<br>Frequency: %{y:.1f}Hz<br>Amplitude: %{z:.1f}dB<extra></extra>'),
             row=2, col=1
         )
         
-        # Add frequency analysis (dominant frequencies over time)
-        dominant_freqs = dominant_freq_series(self.audio_data, self.sample_rate)
-        freq_times = np.linspace(0, len(self.audio_data) / self.sample_rate * 1000, len(dominant_freqs))
+        # Add frequency analysis (dominant frequencies over time), reusing
+        # the series precomputed from the spectrogram argmax
+        if self._dominant_freqs is not None:
+            dominant_freqs = self._dominant_freqs
+            freq_times = self.times * 1000
+        else:
+            dominant_freqs = _batched_dominant_freqs(self.audio_data, self.sample_rate)
+            freq_times = np.linspace(
+                0, self.duration * 1000, len(dominant_freqs))
         
         fig.add_trace(
-            go.Scatter(x=freq_times, y=dominant_freqs,
+            go.Scattergl(x=freq_times, y=dominant_freqs,
                       mode='lines+markers', name='Dominant Frequency',
                       line=dict(color='red', width=2),
                       marker=dict(size=4)),
@@ -252,9 +422,17 @@ class Advanced3DAudioVisualizer:
             
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
         
-        # Time domain - full waveform
-        time_axis = np.linspace(0, len(self.audio_data) / self.sample_rate * 1000, len(self.audio_data))
-        ax1.plot(time_axis, self.audio_data, 'b-', linewidth=0.5)
+        # Time domain - full waveform, drawn as a per-bin min/max envelope
+        # (~4000 display points) instead of one line segment per sample
+        time_axis = self.time_axis_ms
+        q = max(1, len(self.audio_data) // 4000)
+        if q > 1:
+            edges = np.arange(0, len(self.audio_data), q)
+            env_lo = np.minimum.reduceat(self.audio_data, edges)
+            env_hi = np.maximum.reduceat(self.audio_data, edges)
+            ax1.fill_between(time_axis[edges], env_lo, env_hi, color='b', linewidth=0.5)
+        else:
+            ax1.plot(time_axis, self.audio_data, 'b-', linewidth=0.5)
         ax1.set_title('Time Domain - Full Waveform')
         ax1.set_xlabel('Time (ms)')
         ax1.set_ylabel('Amplitude')
@@ -272,24 +450,29 @@ class Advanced3DAudioVisualizer:
         ax2.set_ylabel('Amplitude')
         ax2.grid(True, alpha=0.3)
         
-        # Frequency domain - FFT of full signal
-        fft_data = np.abs(fft(self.audio_data))
-        fft_freqs = fftfreq(len(self.audio_data), 1/self.sample_rate)
-        
-        # Only plot positive frequencies
-        pos_mask = fft_freqs >= 0
-        ax3.semilogx(fft_freqs[pos_mask], 20 * np.log10(fft_data[pos_mask] + 1e-10), 'g-')
+        # Frequency domain - real FFT of full signal (positive freqs only).
+        # Trim to the displayed 20 Hz..Nyquist range with one searchsorted
+        # instead of handing matplotlib bins that set_xlim clips anyway.
+        spectrum = rfft(self.audio_data, workers=-1)
+        fft_freqs = rfftfreq(len(self.audio_data), 1/self.sample_rate)
+        lo = int(np.searchsorted(fft_freqs, 20.0))
+        ax3.semilogx(fft_freqs[lo:], _mag_db(spectrum[lo:]), 'g-')
         ax3.set_title('Frequency Domain - Full Spectrum')
         ax3.set_xlabel('Frequency (Hz)')
         ax3.set_ylabel('Magnitude (dB)')
         ax3.grid(True, alpha=0.3)
         ax3.set_xlim(20, self.sample_rate // 2)
         
-        # Frequency domain - spectrogram
-        im = ax4.imshow(self.spectrogram, aspect='auto', origin='lower',
-                       extent=[self.times[0]*1000, self.times[-1]*1000, 
-                              self.frequencies[0], self.frequencies[-1]],
-                       cmap='viridis')
+        # Frequency domain - spectrogram, downsampled to display resolution;
+        # rasterized=True bakes the mesh once on vector export and the
+        # percentile limits avoid matplotlib's full-array autoscale scan
+        fstep = max(1, self.spectrogram.shape[0] // 512)
+        tstep = max(1, self.spectrogram.shape[1] // 1024)
+        spec_vis = self.spectrogram[::fstep, ::tstep]
+        vmin, vmax = np.percentile(spec_vis, [2, 98])
+        im = ax4.pcolormesh(self.times[::tstep]*1000, self.frequencies[::fstep],
+                            spec_vis, cmap='viridis', shading='nearest',
+                            rasterized=True, vmin=vmin, vmax=vmax)
         ax4.set_title('Frequency Domain - Spectrogram')
         ax4.set_xlabel('Time (ms)')
         ax4.set_ylabel('Frequency (Hz)')
@@ -309,33 +492,22 @@ class Advanced3DAudioVisualizer:
         # Simulate real-time by processing chunks
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
         
-        # Initialize waterfall data
-        waterfall_history = []
-        
-        # Process audio in chunks
-        for i in range(0, len(self.audio_data) - chunk_size, chunk_size // 2):
-            chunk = self.audio_data[i:i + chunk_size]
-            
-            # Calculate FFT for this chunk
-            fft_chunk = np.abs(fft(chunk * np.hanning(len(chunk))))
-            fft_freqs = fftfreq(len(chunk), 1/self.sample_rate)
-            
-            # Only keep positive frequencies up to 8kHz for visualization
-            max_freq_idx = np.where(fft_freqs <= 8000)[0][-1]
-            fft_chunk = fft_chunk[:max_freq_idx]
-            fft_freqs = fft_freqs[:max_freq_idx]
-            
-            # Convert to dB
-            fft_db = 20 * np.log10(fft_chunk + 1e-10)
-            
-            waterfall_history.append(fft_db)
-            
-            # Keep only last 100 frames
-            if len(waterfall_history) > 100:
-                waterfall_history.pop(0)
-        
-        # Create waterfall display
-        waterfall_array = np.array(waterfall_history).T
+        # Cached analysis window and frequency axis, computed once
+        window = _hann(chunk_size)
+        fft_freqs = rfftfreq(chunk_size, 1/self.sample_rate)
+        # Only keep positive frequencies up to 8kHz for visualization
+        max_freq_idx = int(np.searchsorted(fft_freqs, 8000.0, side='right'))
+        fft_freqs = fft_freqs[:max_freq_idx]
+
+        # Frame the signal with a zero-copy strided view, keep the last
+        # 100 frames by slicing, and batch all FFTs into one rfft call
+        hop = chunk_size // 2
+        frames = np.lib.stride_tricks.sliding_window_view(
+            self.audio_data, chunk_size)[::hop][-100:]
+        spectra = rfft(frames * window, axis=1, workers=-1)[:, :max_freq_idx]
+
+        # Convert to dB; transpose is a view (frequency rows, time columns)
+        waterfall_array = _mag_db(spectra).T
         
         # Plot current spectrum
         ax1.plot(fft_freqs, waterfall_array[:, -1], 'b-', linewidth=2)
@@ -347,7 +519,7 @@ class Advanced3DAudioVisualizer:
         
         # Plot waterfall
         im = ax2.imshow(waterfall_array, aspect='auto', origin='lower',
-                       extent=[0, len(waterfall_history), fft_freqs[0], fft_freqs[-1]],
+                       extent=[0, waterfall_array.shape[1], fft_freqs[0], fft_freqs[-1]],
                        cmap='plasma')
         ax2.set_title('Spectral Waterfall Display')
         ax2.set_xlabel('Time (frames)')
@@ -373,15 +545,21 @@ class Advanced3DAudioVisualizer:
             
         end_idx = min(end_idx, len(self.audio_data))
         segment = self.audio_data[start_idx:end_idx]
-        
-        # Convert to 16-bit integers for pygame
-        segment_int = (segment * 32767).astype(np.int16)
-        
-        # Create stereo array
-        stereo_segment = np.zeros((len(segment_int), 2), dtype=np.int16)
-        stereo_segment[:, 0] = segment_int
-        stereo_segment[:, 1] = segment_int
-        
+
+        import pygame
+        if self.audio_player is None:
+            pygame.mixer.init()
+            self.audio_player = pygame.mixer
+        
+        # Convert to 16-bit integers for pygame, clipping instead of
+        # wrapping on overdriven samples
+        segment_int = np.clip(segment * 32767.0, -32768, 32767).astype(np.int16)
+
+        # Duplicate the channel by broadcast (a view) and make the result
+        # contiguous for pygame in one copy instead of two strided writes
+        stereo_segment = np.ascontiguousarray(
+            np.broadcast_to(segment_int[:, None], (len(segment_int), 2)))
+
         try:
             sound = pygame.sndarray.make_sound(stereo_segment)
             sound.play()
@@ -394,7 +572,7 @@ class Advanced3DAudioVisualizer:
         try:
             if hasattr(fig, 'write_html'):  # Plotly figure
                 if format == 'html':
-                    fig.write_html(filename)
+                    fig.write_html(filename, include_plotlyjs='cdn')
                 elif format == 'png':
                     fig.write_image(filename)
                 elif format == 'pdf':
@@ -415,6 +593,9 @@ class Advanced3DAudioVisualizer:
 
 def create_gui_interface():
     """Create GUI interface for the advanced visualizer"""
+    import tkinter as tk
+    from tkinter import filedialog, messagebox
+
     root = tk.Tk()
     root.title("Advanced 3D Audio Visualizer - SONAR")
     root.geometry("600x400")
@@ -436,6 +617,7 @@ def create_gui_interface():
                 messagebox.showerror("Error", "Failed to load audio file")
     
     def show_3d_landscape():
+        import plotly.offline as pyo
         fig = visualizer.create_3d_frequency_landscape(interactive=True)
         if fig:
             exports_dir = Path(__file__).parent / 'exports'
@@ -444,6 +626,7 @@ def create_gui_interface():
             pyo.plot(fig, filename=str(output_path), auto_open=True)
     
     def show_interactive_scrubbing():
+        import plotly.offline as pyo
         fig = visualizer.create_interactive_scrubbing_interface()
         if fig:
             exports_dir = Path(__file__).parent / 'exports'
@@ -517,27 +700,43 @@ if __name__ == "__main__":
         
         if visualizer.load_audio_file(audio_file):
             print("Creating visualizations...")
-            
-            # Create all visualizations
-            fig_3d = visualizer.create_3d_frequency_landscape(interactive=True)
+
+            # Build the four figures concurrently; the FFT-heavy parts
+            # release the GIL so they overlap on multi-core machines.
+            # Agg keeps matplotlib off GUI backends in worker threads.
+            import matplotlib
+            matplotlib.use('Agg', force=True)
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=4) as ex:
+                fut_3d = ex.submit(visualizer.create_3d_frequency_landscape, True)
+                fut_scrub = ex.submit(visualizer.create_interactive_scrubbing_interface)
+                fut_dual = ex.submit(visualizer.create_dual_domain_analysis)
+                fut_waterfall = ex.submit(visualizer.create_realtime_waterfall_display)
+
+            # Write sequentially; figure serialization is not thread-safe
+            fig_3d = fut_3d.result()
             if fig_3d:
                 fig_3d.write_html("3d_landscape.html")
                 print("3D landscape saved to 3d_landscape.html")
-            
-            fig_scrub = visualizer.create_interactive_scrubbing_interface()
+
+            fig_scrub = fut_scrub.result()
             if fig_scrub:
                 fig_scrub.write_html("interactive_scrubbing.html")
                 print("Interactive scrubbing saved to interactive_scrubbing.html")
-            
-            fig_dual = visualizer.create_dual_domain_analysis()
+
+            fig_dual = fut_dual.result()
             if fig_dual:
                 fig_dual.savefig("dual_domain_analysis.png", dpi=300, bbox_inches='tight')
                 print("Dual domain analysis saved to dual_domain_analysis.png")
-            
-            fig_waterfall = visualizer.create_realtime_waterfall_display()
+
+            fig_waterfall = fut_waterfall.result()
             if fig_waterfall:
                 fig_waterfall.savefig("spectral_waterfall.png", dpi=300, bbox_inches='tight')
                 print("Spectral waterfall saved to spectral_waterfall.png")
+
+            # CLI mode never plays audio back; release the raw buffer
+            visualizer.unload_timeseries()
         else:
             print(f"Failed to load audio file: {audio_file}")
     else:
@@ -5,16 +5,106 @@ Combines the original sound_ball.py functionality with new 3D visualization feat
 """
 
 import sys
+import os
 import math
 import argparse
 import colorsys
 import time
 from pathlib import Path
 import numpy as np
-import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
+import queue
 import threading
-import pygame
+
+# tkinter, pygame, matplotlib and plotly are imported lazily where they
+# are used: startup (and --help) should not pay for the full GUI stack,
+# and the mixer should not open an audio device until playback is needed.
+
+_PLT = None
+_PYO = None
+
+# When False (the default), matplotlib runs on the offscreen Agg backend
+# and figures are shown by writing a temp PNG and opening it in the OS
+# viewer: no Tk/Qt backend init, and showing a figure can never block
+# the Textual event loop. --interactive-mpl restores blocking windows.
+_MPL_INTERACTIVE = False
+
+def _plt():
+    """Memoized matplotlib.pyplot import for the button handlers."""
+    global _PLT
+    if _PLT is None:
+        if not _MPL_INTERACTIVE:
+            import matplotlib
+            matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        _PLT = plt
+    return _PLT
+
+def _force_agg():
+    """Force the offscreen Agg backend before threaded figure builds.
+
+    The export paths run plt.subplots on pool workers, and GUI backends
+    (TkAgg) only work on the main thread. force=True also covers
+    --interactive-mpl, where _plt() leaves the GUI backend selected.
+    """
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+    return _plt()
+
+def _show_mpl_fig(fig):
+    """Display a matplotlib figure without blocking the event loop."""
+    if _MPL_INTERACTIVE:
+        _plt().show()
+        return
+    import tempfile
+    import webbrowser
+    fd, tmp = tempfile.mkstemp(suffix='.png', prefix='sonar_fig_')
+    os.close(fd)
+    fig.savefig(tmp)
+    webbrowser.open(f'file://{tmp}')
+
+def _pyo():
+    """Memoized plotly.offline import for the button handlers."""
+    global _PYO
+    if _PYO is None:
+        import plotly.offline as pyo
+        _PYO = pyo
+    return _PYO
+
+def _save_mpl_fig(fig, path_base, fmt='svg', dpi=0):
+    """Save a matplotlib figure for export, returning the output path.
+
+    SVG is the default: vector output skips the Agg rasterization that
+    dominates export time at high DPI. The tight-bbox relayout is only
+    paid on the raster path, where cropping actually matters.
+    """
+    if fmt == 'svg':
+        out = f"{path_base}.svg"
+        fig.savefig(out)
+    else:
+        out = f"{path_base}.png"
+        dpi = dpi or _plt().rcParams['figure.dpi']
+        fig.savefig(out, dpi=dpi, bbox_inches='tight')
+    return out
+
+def _export_targets(base):
+    """Resolve the export output paths under ``base``, creating it once.
+
+    The matplotlib entries are extension-less stems for _save_mpl_fig,
+    which appends .svg or .png depending on the chosen format.
+    """
+    base = Path(base)
+    base.mkdir(parents=True, exist_ok=True)
+    return {
+        'landscape': base / '3d_landscape.html',
+        'scrubbing': base / 'interactive_scrubbing.html',
+        'dual_domain': base / 'dual_domain_analysis',
+        'waterfall': base / 'spectral_waterfall',
+    }
+
+# Shared immutable default so the UI thread never allocates one on the
+# way to the first frame
+_DEFAULT_FREQS = np.array([440.0], dtype=np.float32)  # A4
+_DEFAULT_FREQS.flags.writeable = False
 
 # Import original sound_ball functionality
 try:
@@ -26,6 +116,43 @@ except ImportError:
     print("Warning: Could not import from sound_ball.py")
     # Fallback implementations would go here
 
+def _cached_dominant_freqs(path, sr, hop=2048, win=4096, fmin=30.0, fmax=6000.0):
+    """dominant_freq_series with an on-disk .npy sidecar cache.
+
+    Keyed by file path + mtime and the analysis parameters, so relaunching
+    on the same file loads the series in milliseconds instead of re-running
+    the STFT. Cache failures silently fall back to recomputing.
+    """
+    import hashlib
+    cache_dir = Path.home() / '.cache' / 'sonar_project'
+    cache_file = None
+    try:
+        mtime = os.path.getmtime(path)
+        key = hashlib.blake2b(
+            f"{path}|{mtime}|{sr}|{hop}|{win}|{fmin}|{fmax}".encode()).hexdigest()[:16]
+        cache_file = cache_dir / f"freqs_{key}.npy"
+        if cache_file.exists():
+            return np.load(cache_file)
+    except OSError:
+        cache_file = None
+
+    y, sr = load_audio_mono(path, target_sr=sr)
+    # Analysis is memory-bound: float32 halves the bytes every FFT reads
+    # with no visible precision loss in a spectrogram
+    y = np.ascontiguousarray(y, dtype=np.float32)
+    freqs = dominant_freq_series(y, sr, win=win, hop=hop, fmin=fmin, fmax=fmax)
+
+    if cache_file is not None:
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_name(cache_file.name + '.tmp')
+            with open(tmp, 'wb') as f:
+                np.save(f, freqs)
+            tmp.replace(cache_file)  # atomic rename, no torn cache entries
+        except OSError:
+            pass
+    return freqs
+
 # Import advanced visualization
 try:
     from advanced_audio_viz import Advanced3DAudioVisualizer
@@ -43,9 +170,16 @@ from textual import events
 class Enhanced3DVisualizationScreen(ModalScreen):
     """Modal screen for 3D visualization options"""
     
-    def __init__(self, visualizer, **kwargs):
+    def __init__(self, visualizer, player=None, **kwargs):
         super().__init__(**kwargs)
         self.visualizer = visualizer
+        self.player = player
+
+    def _build_fig(self, kind, builder):
+        """Build a figure through the player's cache when one is attached."""
+        if self.player is not None:
+            return self.player.get_or_build_fig(kind, builder)
+        return builder()
     
     def compose(self) -> ComposeResult:
         with Container(id="viz-modal"):
@@ -79,9 +213,11 @@ class Enhanced3DVisualizationScreen(ModalScreen):
         """Create and display 3D frequency landscape"""
         if self.visualizer:
             try:
-                fig = self.visualizer.create_3d_frequency_landscape(interactive=True)
+                fig = self._build_fig(
+                    'landscape',
+                    lambda: self.visualizer.create_3d_frequency_landscape(interactive=True))
                 if fig:
-                    import plotly.offline as pyo
+                    pyo = _pyo()
                     pyo.plot(fig, filename='3d_landscape.html', auto_open=True)
                     self.notify("3D Landscape visualization opened in browser")
                 else:
@@ -93,9 +229,11 @@ class Enhanced3DVisualizationScreen(ModalScreen):
         """Create interactive scrubbing interface"""
         if self.visualizer:
             try:
-                fig = self.visualizer.create_interactive_scrubbing_interface()
+                fig = self._build_fig(
+                    'scrubbing',
+                    lambda: self.visualizer.create_interactive_scrubbing_interface())
                 if fig:
-                    import plotly.offline as pyo
+                    pyo = _pyo()
                     pyo.plot(fig, filename='interactive_scrubbing.html', auto_open=True)
                     self.notify("Interactive scrubbing interface opened in browser")
                 else:
@@ -107,10 +245,11 @@ class Enhanced3DVisualizationScreen(ModalScreen):
         """Create dual domain analysis"""
         if self.visualizer:
             try:
-                fig = self.visualizer.create_dual_domain_analysis()
+                fig = self._build_fig(
+                    'dual_domain',
+                    lambda: self.visualizer.create_dual_domain_analysis())
                 if fig:
-                    import matplotlib.pyplot as plt
-                    plt.show()
+                    _show_mpl_fig(fig)
                     self.notify("Dual domain analysis displayed")
                 else:
                     self.notify("Failed to create dual domain analysis", severity="error")
@@ -121,10 +260,11 @@ class Enhanced3DVisualizationScreen(ModalScreen):
         """Create spectral waterfall display"""
         if self.visualizer:
             try:
-                fig = self.visualizer.create_realtime_waterfall_display()
+                fig = self._build_fig(
+                    'waterfall',
+                    lambda: self.visualizer.create_realtime_waterfall_display())
                 if fig:
-                    import matplotlib.pyplot as plt
-                    plt.show()
+                    _show_mpl_fig(fig)
                     self.notify("Spectral waterfall display shown")
                 else:
                     self.notify("Failed to create waterfall display", severity="error")
@@ -135,35 +275,44 @@ class Enhanced3DVisualizationScreen(ModalScreen):
         """Export all visualizations to files"""
         if self.visualizer:
             try:
-                # Create all visualizations and export them
+                from concurrent.futures import ThreadPoolExecutor
+
+                # Build the four figures concurrently (the FFT-heavy work
+                # releases the GIL); writes stay sequential because figure
+                # serialization is not thread-safe. Agg keeps matplotlib
+                # off GUI backends in the worker threads.
+                _force_agg()
+                builders = {
+                    'landscape': lambda: self.visualizer.create_3d_frequency_landscape(interactive=True),
+                    'scrubbing': lambda: self.visualizer.create_interactive_scrubbing_interface(),
+                    'dual_domain': lambda: self.visualizer.create_dual_domain_analysis(),
+                    'waterfall': lambda: self.visualizer.create_realtime_waterfall_display(),
+                }
+                with ThreadPoolExecutor(max_workers=4) as ex:
+                    futures = {kind: ex.submit(self._build_fig, kind, builder)
+                               for kind, builder in builders.items()}
+                    figs = {kind: fut.result() for kind, fut in futures.items()}
+
+                targets = _export_targets("exports")
+                writers = {
+                    'landscape': lambda fig: fig.write_html(str(targets['landscape'])),
+                    'scrubbing': lambda fig: fig.write_html(str(targets['scrubbing'])),
+                    'dual_domain': lambda fig: _save_mpl_fig(fig, str(targets['dual_domain'])),
+                    'waterfall': lambda fig: _save_mpl_fig(fig, str(targets['waterfall'])),
+                }
                 export_count = 0
-                
-                # 3D Landscape
-                fig_3d = self.visualizer.create_3d_frequency_landscape(interactive=True)
-                if fig_3d:
-                    fig_3d.write_html("exports/3d_landscape.html")
-                    export_count += 1
-                
-                # Interactive Scrubbing
-                fig_scrub = self.visualizer.create_interactive_scrubbing_interface()
-                if fig_scrub:
-                    fig_scrub.write_html("exports/interactive_scrubbing.html")
-                    export_count += 1
-                
-                # Dual Domain
-                fig_dual = self.visualizer.create_dual_domain_analysis()
-                if fig_dual:
-                    fig_dual.savefig("exports/dual_domain_analysis.png", dpi=300, bbox_inches='tight')
-                    export_count += 1
-                
-                # Waterfall
-                fig_waterfall = self.visualizer.create_realtime_waterfall_display()
-                if fig_waterfall:
-                    fig_waterfall.savefig("exports/spectral_waterfall.png", dpi=300, bbox_inches='tight')
-                    export_count += 1
-                
+                for kind, write in writers.items():
+                    if not figs[kind]:
+                        continue
+                    # One failed write should not abort the rest
+                    try:
+                        write(figs[kind])
+                        export_count += 1
+                    except Exception as e:
+                        self.notify(f"Failed to export {kind}: {e}", severity="error")
+
                 self.notify(f"Exported {export_count} visualizations to exports/ folder")
-                
+
             except Exception as e:
                 self.notify(f"Error exporting visualizations: {e}", severity="error")
 
@@ -171,21 +320,76 @@ class EnhancedAudioPlayer:
     """Enhanced audio player with 3D visualization capabilities"""
     
     def __init__(self):
-        pygame.mixer.init()
-        self.sound = None
         self.is_playing = False
         self.is_paused = False
         self.file_path = None
         self.visualizer = None
-        
+        self._mixer_ready = False
+        # Figures keyed by (file_path, mtime, kind): repeated button
+        # presses and Export All reuse a build instead of re-running the
+        # whole STFT + figure pipeline
+        self._fig_cache = {}
+
         if Advanced3DAudioVisualizer:
             self.visualizer = Advanced3DAudioVisualizer()
-    
+
+    def get_or_build_fig(self, kind, builder):
+        """Return the cached figure for (current file, kind), building once."""
+        if not self.file_path:
+            return builder()
+        try:
+            mtime = os.path.getmtime(self.file_path)
+        except OSError:
+            mtime = 0.0
+        key = (self.file_path, mtime, kind)
+        fig = self._fig_cache.get(key)
+        if fig is None:
+            fig = builder()
+            if fig is not None:
+                self._fig_cache[key] = fig
+        return fig
+
+    def _ensure_mixer(self):
+        """Open the audio device on first use rather than at construction."""
+        global pygame
+        import pygame
+        if not self._mixer_ready:
+            pygame.mixer.init()
+            self._mixer_ready = True
+
+    def _release_caches(self):
+        """Drop the previous file's buffers before decoding a new one.
+
+        Without this, switching files repeatedly leaves the old decoded
+        audio, its STFT arrays, cached figures and Agg canvases all
+        reachable, and memory grows for the length of the session.
+        """
+        import gc
+        self._fig_cache.clear()
+        if self.visualizer is not None and self.file_path:
+            self.visualizer.audio_data = None
+            self.visualizer.spectrogram = None
+            self.visualizer.frequencies = None
+            self.visualizer.times = None
+            self.visualizer._time_axis_ms = None
+            self.visualizer._dominant_freqs = None
+        if _PLT is not None:
+            _PLT.close('all')
+        gc.collect()
+
     def load_file(self, file_path):
         """Load audio file for both playback and visualization"""
         try:
-            # Load for pygame playback
-            self.sound = pygame.mixer.Sound(file_path)
+            # Switching files invalidates any cached figures and buffers
+            self._release_caches()
+
+            # Stream from disk via mixer.music rather than decoding the
+            # whole file into a Sound buffer: load latency drops to a
+            # file open and memory stays at one small decode buffer.
+            # Sample-accurate slicing in play_segment goes through the
+            # visualizer, which already holds the decoded samples.
+            self._ensure_mixer()
+            pygame.mixer.music.load(file_path)
             self.file_path = file_path
             
             # Load for visualization
@@ -200,25 +404,27 @@ class EnhancedAudioPlayer:
             return False
     
     def play(self):
-        if self.sound and not self.is_playing:
+        if self.file_path and not self.is_playing:
             if self.is_paused:
-                pygame.mixer.unpause()
+                pygame.mixer.music.unpause()
                 self.is_paused = False
             else:
-                self.sound.play()
+                pygame.mixer.music.play()
             self.is_playing = True
     
     def pause(self):
         if self.is_playing:
-            pygame.mixer.pause()
+            pygame.mixer.music.pause()
             self.is_playing = False
             self.is_paused = True
     
     def stop(self):
-        pygame.mixer.stop()
+        if not self._mixer_ready:
+            return
+        pygame.mixer.music.stop()
         self.is_playing = False
         self.is_paused = False
-    
+
     def play_segment(self, start_time, duration=1.0):
         """Play a specific segment using the visualizer"""
         if self.visualizer:
@@ -289,15 +495,36 @@ class EnhancedFreqBallApp(FreqBallApp):
     def __init__(self, freqs=None, sr=22050, hop=2048, win=4096, fmin=30.0, fmax=6000.0, audio_file=None, **kwargs):
         # Use default values if not provided
         if freqs is None:
-            freqs = np.array([440.0])  # Default A4 frequency
-        
+            freqs = _DEFAULT_FREQS
+
+        # One contiguous float32 array shared read-only by the app and the
+        # visualizer: halves memory traffic versus the default float64 and
+        # avoids each half re-deriving its own copy
+        freqs = np.ascontiguousarray(freqs, dtype=np.float32)
+        freqs.flags.writeable = False
+
         super().__init__(freqs, sr, hop, win, fmin, fmax, audio_file, **kwargs)
+        # 4096-entry hue table built once: the animation loop then colors
+        # the ball with a list index instead of per-frame colorsys math
+        self._hue_lut = [hz_to_hex_color(f, hz_min=fmin, hz_max=fmax)
+                         for f in np.linspace(fmin, fmax, 4096)]
         self.enhanced_player = EnhancedAudioPlayer()
+        if self.enhanced_player.visualizer is not None:
+            self.enhanced_player.visualizer.freqs = self.freqs
         self.current_file = audio_file
-    
+        self._reload_attempted = None
+
+    def on_mount(self):
+        super().on_mount()
+        # Pre-warm the heavy plotting imports off the UI thread so the
+        # first visualization click does not stall on them
+        threading.Thread(target=_plt, daemon=True).start()
+        threading.Thread(target=_pyo, daemon=True).start()
+
     def compose(self) -> ComposeResult:
         # Initialize components first
         self.ball = Ball()
+        self.ball.set_color_lut(self._hue_lut, self.fmin, self.fmax)
         self.label = FreqLabel(id="freq")
         self.filename_label = FileNameLabel(id="filename")
         
@@ -352,17 +579,57 @@ class EnhancedFreqBallApp(FreqBallApp):
         elif event.button.id == "btn-waterfall":
             self._create_waterfall()
     
+    # File dialogs run on one dedicated daemon thread that owns a hidden
+    # Tk root: Tk startup (Tcl interpreter, font loading) costs a few
+    # hundred ms, so pay it once — and Tcl interpreters are thread-
+    # affine, so every open must happen on the thread that created the
+    # root, not on whichever pool worker picks up the job.
+    _dialog_requests = None
+    _dialog_lock = threading.Lock()
+
+    @staticmethod
+    def _dialog_thread_main(requests):
+        """Own the hidden Tk root and serve file-dialog requests."""
+        try:
+            import tkinter as tk
+            from tkinter import filedialog
+            root = tk.Tk()
+            root.withdraw()  # Hide the main window
+        except Exception as e:
+            while True:
+                _, reply = requests.get()
+                reply.put(e)
+        while True:
+            options, reply = requests.get()
+            try:
+                reply.put(filedialog.askopenfilename(parent=root, **options))
+            except Exception as e:
+                reply.put(e)
+
+    @classmethod
+    def _open_file_dialog(cls, **options):
+        """Open a file dialog on the Tk thread; block for the chosen
+        path ('' when cancelled)."""
+        with cls._dialog_lock:
+            if cls._dialog_requests is None:
+                cls._dialog_requests = queue.Queue()
+                threading.Thread(
+                    target=cls._dialog_thread_main,
+                    args=(cls._dialog_requests,),
+                    daemon=True,
+                ).start()
+        reply = queue.Queue(maxsize=1)
+        cls._dialog_requests.put((options, reply))
+        result = reply.get()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
     def _load_audio_file(self):
         """Load audio file using file dialog"""
         def load_in_thread():
             try:
-                import tkinter as tk
-                from tkinter import filedialog
-                
-                root = tk.Tk()
-                root.withdraw()  # Hide the main window
-                
-                file_path = filedialog.askopenfilename(
+                file_path = self._open_file_dialog(
                     title="Select Audio File",
                     filetypes=[
                         ("Audio Files", "*.wav *.mp3 *.flac *.ogg"),
@@ -370,23 +637,21 @@ class EnhancedFreqBallApp(FreqBallApp):
                         ("All Files", "*.*")
                     ]
                 )
-                
-                root.destroy()
-                
+
                 if file_path:
                     success = self.enhanced_player.load_file(file_path)
                     if success:
                         self.current_file = file_path
-                        file_name = Path(file_path).name
+                        file_name = os.path.basename(file_path)
                         self.call_from_thread(self._update_file_info, file_name)
                         self.notify(f"Loaded: {file_name}")
                     else:
                         self.call_from_thread(self.notify, "Failed to load audio file", severity="error")
-                        
+
             except Exception as e:
                 self.call_from_thread(self.notify, f"Error loading file: {e}", severity="error")
-        
-        threading.Thread(target=load_in_thread, daemon=True).start()
+
+        self.run_worker(load_in_thread, thread=True, exclusive=True, group="file-dialog")
     
     def _update_file_info(self, filename):
         """Update file info display"""
@@ -396,34 +661,46 @@ class EnhancedFreqBallApp(FreqBallApp):
     def _show_advanced_viz(self):
         """Show advanced visualization modal"""
         if self.enhanced_player.visualizer and self.current_file:
-            modal = Enhanced3DVisualizationScreen(self.enhanced_player.visualizer)
+            modal = Enhanced3DVisualizationScreen(self.enhanced_player.visualizer,
+                                                  player=self.enhanced_player)
             self.push_screen(modal)
         else:
             self.notify("Please load an audio file first", severity="warning")
     
-    def _create_3d_landscape(self):
-        """Create 3D landscape visualization"""
+    def _ensure_ready(self):
+        """Guard for the visualization handlers.
+
+        Returns True iff the visualizer exists, a file is loaded, and its
+        audio data is present — attempting at most one reload per file so
+        rapid clicking cannot trigger repeated re-parses.
+        """
         if not self.enhanced_player.visualizer:
             self.notify("3D Visualizer not available", severity="error")
-            return
-            
+            return False
         if not self.current_file:
             self.notify("Please load an audio file first", severity="warning")
-            return
-            
-        # Check if audio data is actually loaded in the visualizer
+            return False
         if self.enhanced_player.visualizer.audio_data is None:
-            self.notify("Audio data not loaded. Please reload the file.", severity="warning")
-            # Try to reload the file
-            success = self.enhanced_player.visualizer.load_audio_file(self.current_file)
-            if not success:
+            if self._reload_attempted == self.current_file:
+                self.notify("Audio data not loaded. Please reload the file.", severity="warning")
+                return False
+            self._reload_attempted = self.current_file
+            if not self.enhanced_player.visualizer.load_audio_file(self.current_file):
                 self.notify("Failed to load audio data for visualization", severity="error")
-                return
-        
+                return False
+        return True
+
+    def _create_3d_landscape(self):
+        """Create 3D landscape visualization"""
+        if not self._ensure_ready():
+            return
+
         try:
-            fig = self.enhanced_player.visualizer.create_3d_frequency_landscape(interactive=True)
+            fig = self.enhanced_player.get_or_build_fig(
+                'landscape',
+                lambda: self.enhanced_player.visualizer.create_3d_frequency_landscape(interactive=True))
             if fig:
-                import plotly.offline as pyo
+                pyo = _pyo()
                 pyo.plot(fig, filename='3d_landscape.html', auto_open=True)
                 self.notify("3D Landscape opened in browser")
             else:
@@ -433,25 +710,15 @@ class EnhancedFreqBallApp(FreqBallApp):
     
     def _create_scrubbing(self):
         """Create interactive scrubbing interface"""
-        if not self.enhanced_player.visualizer:
-            self.notify("3D Visualizer not available", severity="error")
-            return
-            
-        if not self.current_file:
-            self.notify("Please load an audio file first", severity="warning")
+        if not self._ensure_ready():
             return
-            
-        # Check if audio data is actually loaded in the visualizer
-        if self.enhanced_player.visualizer.audio_data is None:
-            success = self.enhanced_player.visualizer.load_audio_file(self.current_file)
-            if not success:
-                self.notify("Failed to load audio data for visualization", severity="error")
-                return
-        
+
         try:
-            fig = self.enhanced_player.visualizer.create_interactive_scrubbing_interface()
+            fig = self.enhanced_player.get_or_build_fig(
+                'scrubbing',
+                lambda: self.enhanced_player.visualizer.create_interactive_scrubbing_interface())
             if fig:
-                import plotly.offline as pyo
+                pyo = _pyo()
                 pyo.plot(fig, filename='interactive_scrubbing.html', auto_open=True)
                 self.notify("Interactive scrubbing opened in browser")
             else:
@@ -461,26 +728,15 @@ class EnhancedFreqBallApp(FreqBallApp):
     
     def _create_dual_analysis(self):
         """Create dual domain analysis"""
-        if not self.enhanced_player.visualizer:
-            self.notify("3D Visualizer not available", severity="error")
-            return
-            
-        if not self.current_file:
-            self.notify("Please load an audio file first", severity="warning")
+        if not self._ensure_ready():
             return
-            
-        # Check if audio data is actually loaded in the visualizer
-        if self.enhanced_player.visualizer.audio_data is None:
-            success = self.enhanced_player.visualizer.load_audio_file(self.current_file)
-            if not success:
-                self.notify("Failed to load audio data for visualization", severity="error")
-                return
-        
+
         try:
-            fig = self.enhanced_player.visualizer.create_dual_domain_analysis()
+            fig = self.enhanced_player.get_or_build_fig(
+                'dual_domain',
+                lambda: self.enhanced_player.visualizer.create_dual_domain_analysis())
             if fig:
-                import matplotlib.pyplot as plt
-                plt.show()
+                _show_mpl_fig(fig)
                 self.notify("Dual domain analysis displayed")
             else:
                 self.notify("Failed to create dual domain analysis", severity="error")
@@ -489,26 +745,15 @@ class EnhancedFreqBallApp(FreqBallApp):
     
     def _create_waterfall(self):
         """Create spectral waterfall display"""
-        if not self.enhanced_player.visualizer:
-            self.notify("3D Visualizer not available", severity="error")
+        if not self._ensure_ready():
             return
-            
-        if not self.current_file:
-            self.notify("Please load an audio file first", severity="warning")
-            return
-            
-        # Check if audio data is actually loaded in the visualizer
-        if self.enhanced_player.visualizer.audio_data is None:
-            success = self.enhanced_player.visualizer.load_audio_file(self.current_file)
-            if not success:
-                self.notify("Failed to load audio data for visualization", severity="error")
-                return
-        
+
         try:
-            fig = self.enhanced_player.visualizer.create_realtime_waterfall_display()
+            fig = self.enhanced_player.get_or_build_fig(
+                'waterfall',
+                lambda: self.enhanced_player.visualizer.create_realtime_waterfall_display())
             if fig:
-                import matplotlib.pyplot as plt
-                plt.show()
+                _show_mpl_fig(fig)
                 self.notify("Spectral waterfall displayed")
             else:
                 self.notify("Failed to create waterfall display", severity="error")
@@ -521,10 +766,20 @@ def main():
     parser.add_argument("--file", "-f", help="Audio file to load on startup")
     parser.add_argument("--mode", "-m", choices=["gui", "cli", "viz"], default="gui",
                        help="Application mode: gui (default), cli, or viz")
+    parser.add_argument("--interactive-mpl", action="store_true",
+                       help="Show matplotlib figures in a blocking GUI window "
+                            "instead of an offscreen PNG opened by the OS")
+    parser.add_argument("--export-format", choices=["svg", "png"], default="svg",
+                       help="Format for matplotlib exports (svg skips rasterization)")
+    parser.add_argument("--export-dpi", type=int, default=0,
+                       help="DPI for PNG exports (0 = matplotlib display DPI)")
     parser.add_argument("--export", "-e", action="store_true",
                        help="Export all visualizations (CLI mode only)")
     
     args = parser.parse_args()
+
+    global _MPL_INTERACTIVE
+    _MPL_INTERACTIVE = args.interactive_mpl
     
     if args.mode == "cli" or args.mode == "viz":
         # Command line mode
@@ -544,30 +799,44 @@ def main():
             if args.export:
                 print("Creating and exporting all visualizations...")
                 
-                # Create exports directory
-                exports_dir = Path(__file__).parent / "exports"
-                exports_dir.mkdir(exist_ok=True)
+                # Create exports directory and resolve output paths once
+                targets = _export_targets(Path(__file__).parent / "exports")
                 
-                # Export all visualizations
+                # Export all visualizations: build concurrently, write
+                # sequentially once every future has resolved
                 try:
-                    fig_3d = visualizer.create_3d_frequency_landscape(interactive=True)
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    # Agg keeps matplotlib off GUI backends in the
+                    # worker threads
+                    _force_agg()
+
+                    with ThreadPoolExecutor(max_workers=4) as ex:
+                        fut_3d = ex.submit(visualizer.create_3d_frequency_landscape, True)
+                        fut_scrub = ex.submit(visualizer.create_interactive_scrubbing_interface)
+                        fut_dual = ex.submit(visualizer.create_dual_domain_analysis)
+                        fut_waterfall = ex.submit(visualizer.create_realtime_waterfall_display)
+
+                    fig_3d = fut_3d.result()
                     if fig_3d:
-                        fig_3d.write_html(str(exports_dir / "3d_landscape.html"))
+                        fig_3d.write_html(str(targets['landscape']))
                         print("✓ 3D landscape exported")
-                    
-                    fig_scrub = visualizer.create_interactive_scrubbing_interface()
+
+                    fig_scrub = fut_scrub.result()
                     if fig_scrub:
-                        fig_scrub.write_html(str(exports_dir / "interactive_scrubbing.html"))
+                        fig_scrub.write_html(str(targets['scrubbing']))
                         print("✓ Interactive scrubbing exported")
-                    
-                    fig_dual = visualizer.create_dual_domain_analysis()
+
+                    fig_dual = fut_dual.result()
                     if fig_dual:
-                        fig_dual.savefig(str(exports_dir / "dual_domain_analysis.png"), dpi=300, bbox_inches='tight')
+                        _save_mpl_fig(fig_dual, str(targets['dual_domain']),
+                                      args.export_format, args.export_dpi)
                         print("✓ Dual domain analysis exported")
-                    
-                    fig_waterfall = visualizer.create_realtime_waterfall_display()
+
+                    fig_waterfall = fut_waterfall.result()
                     if fig_waterfall:
-                        fig_waterfall.savefig(str(exports_dir / "spectral_waterfall.png"), dpi=300, bbox_inches='tight')
+                        _save_mpl_fig(fig_waterfall, str(targets['waterfall']),
+                                      args.export_format, args.export_dpi)
                         print("✓ Spectral waterfall exported")
                     
                     print("\nAll visualizations exported to exports/ folder")
@@ -588,44 +857,46 @@ def main():
                 if choice == "1":
                     fig = visualizer.create_3d_frequency_landscape(interactive=True)
                     if fig:
-                        import plotly.offline as pyo
+                        pyo = _pyo()
                         pyo.plot(fig, auto_open=True)
                 elif choice == "2":
                     fig = visualizer.create_interactive_scrubbing_interface()
                     if fig:
-                        import plotly.offline as pyo
+                        pyo = _pyo()
                         pyo.plot(fig, auto_open=True)
                 elif choice == "3":
                     fig = visualizer.create_dual_domain_analysis()
                     if fig:
-                        import matplotlib.pyplot as plt
-                        plt.show()
+                        _show_mpl_fig(fig)
                 elif choice == "4":
                     fig = visualizer.create_realtime_waterfall_display()
                     if fig:
-                        import matplotlib.pyplot as plt
-                        plt.show()
+                        _show_mpl_fig(fig)
                 elif choice == "5":
-                    # Show all visualizations
+                    # Show all visualizations. All four builders read the
+                    # spectrogram computed once by load_audio_file, so this
+                    # branch runs a single STFT, not four.
                     print("Creating all visualizations...")
-                    
+
+                    # Resolve plotly up front: fig_scrub's plot call must
+                    # not depend on fig_3d having bound the name first
+                    pyo = _pyo()
+
                     fig_3d = visualizer.create_3d_frequency_landscape(interactive=True)
                     if fig_3d:
-                        import plotly.offline as pyo
                         pyo.plot(fig_3d, filename='3d_landscape.html', auto_open=True)
-                    
+
                     fig_scrub = visualizer.create_interactive_scrubbing_interface()
                     if fig_scrub:
                         pyo.plot(fig_scrub, filename='interactive_scrubbing.html', auto_open=True)
                     
                     fig_dual = visualizer.create_dual_domain_analysis()
                     if fig_dual:
-                        import matplotlib.pyplot as plt
-                        plt.show()
+                        _show_mpl_fig(fig_dual)
                     
                     fig_waterfall = visualizer.create_realtime_waterfall_display()
                     if fig_waterfall:
-                        plt.show()
+                        _show_mpl_fig(fig_waterfall)
         else:
             print(f"Failed to load audio file: {args.file}")
             sys.exit(1)
@@ -638,12 +909,11 @@ def main():
             sr = 22050
             if args.file:
                 try:
-                    y, sr = load_audio_mono(args.file, target_sr=sr)
-                    freqs = dominant_freq_series(y, sr)
+                    freqs = _cached_dominant_freqs(args.file, sr)
                     print(f"Loaded {len(freqs)} frequency samples from {args.file}")
                 except Exception as e:
                     print(f"Warning: Could not analyze audio file: {e}")
-                    freqs = np.array([440.0])  # Default frequency
+                    freqs = _DEFAULT_FREQS
             
             app = EnhancedFreqBallApp(
                 freqs=freqs,
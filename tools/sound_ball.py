@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
-import sys, math, argparse, colorsys, time
+import sys, math, argparse, bisect, colorsys, time, functools
 from pathlib import Path
 import numpy as np
-import tkinter as tk
-from tkinter import filedialog
 import threading
-import pygame
+
+# tkinter and pygame are imported lazily by their only users
+# (show_file_dialog and AudioPlayer), keeping them off the cold-start
+# path for analysis-only runs and for the modules that import us
 
 from textual.app import App, ComposeResult
 from textual.containers import Container
@@ -14,6 +15,19 @@ from textual.screen import ModalScreen
 from textual.widgets import Static, Button, Footer, Input, Label
 from textual import events
 
+# Multithreaded pocketfft when SciPy is around; plain numpy otherwise
+try:
+    from scipy.fft import rfft as _rfft, rfftfreq as _rfftfreq
+    _RFFT_KW = {'workers': -1}
+except ImportError:
+    _rfft, _rfftfreq = np.fft.rfft, np.fft.rfftfreq
+    _RFFT_KW = {}
+
+try:
+    from scipy.signal import resample_poly as _sp_resample_poly
+except ImportError:
+    _sp_resample_poly = None
+
 # --- Try flexible audio loaders ---
 def load_audio_mono(path: str, target_sr: int = 22050):
     """Return (y, sr). Prefers librosa (broad format support); falls back to soundfile."""
@@ -42,7 +56,13 @@ def resample_poly(y, sr_in, sr_out):
     from math import gcd
     g = gcd(sr_in, sr_out)
     up, down = sr_out // g, sr_in // g
-    # Upsample
+    if up == 1 and down == 1:
+        return np.asarray(y, dtype=np.float32)
+    if _sp_resample_poly is not None:
+        # True polyphase: only the outputs that survive decimation are
+        # computed, and the zero-stuffed buffer is never materialized
+        return _sp_resample_poly(y, up, down).astype(np.float32, copy=False)
+    # Fallback: zero-stuff, low-pass, decimate
     y_up = np.zeros(len(y) * up, dtype=np.float32)
     y_up[::up] = y
     # Simple low-pass FIR (Hamming) for decimation
@@ -51,57 +71,87 @@ def resample_poly(y, sr_in, sr_out):
     n = np.arange(taps) - (taps - 1) / 2
     h = np.sinc(2 * cutoff * n) * (0.54 - 0.46 * np.cos(2 * np.pi * np.arange(taps)/(taps-1)))
     h /= h.sum()
-    y_f = np.convolve(y_up, h, mode="same")
+    if len(y_up) > 1 << 17:
+        # FFT-based convolution for long signals: np.convolve is
+        # O(N*K) with no vectorized path at this tap count, while the
+        # transform route is O(N log N). Same 'same'-mode alignment.
+        n = len(y_up) + taps - 1
+        nfft = 1 << (n - 1).bit_length()
+        full = np.fft.irfft(np.fft.rfft(y_up, nfft) * np.fft.rfft(h, nfft), nfft)[:n]
+        start = (taps - 1) // 2
+        y_f = full[start:start + len(y_up)]
+    else:
+        y_f = np.convolve(y_up, h, mode="same")
     return y_f[::down]
 
+@functools.lru_cache(maxsize=8)
+def _hann(n: int) -> np.ndarray:
+    """Hann window of length n, float32, cached across calls."""
+    w = np.hanning(n).astype(np.float32)
+    w.flags.writeable = False
+    return w
+
 def dominant_freq_series(y: np.ndarray, sr: int, win=4096, hop=2048, fmin=30, fmax=6000):
     """Extract dominant frequency over time using FFT."""
+    # float32 end to end: with the float32 window this keeps the framed
+    # multiply at 4 bytes/sample and lets scipy's rfft run in complex64
+    y = np.asarray(y, dtype=np.float32)
     if len(y) < win:
-        return np.array([0.0])
-    
-    freqs = []
-    for i in range(0, len(y) - win + 1, hop):
-        chunk = y[i:i+win]
-        # Apply window
-        windowed = chunk * np.hanning(len(chunk))
-        # FFT
-        fft = np.fft.rfft(windowed)
-        magnitude = np.abs(fft)
-        # Frequency bins
-        freq_bins = np.fft.rfftfreq(len(windowed), 1/sr)
-        # Filter by frequency range
-        valid_idx = (freq_bins >= fmin) & (freq_bins <= fmax)
-        if not np.any(valid_idx):
-            freqs.append(0.0)
-            continue
-        # Find peak
-        peak_idx = np.argmax(magnitude[valid_idx])
-        peak_freq = freq_bins[valid_idx][peak_idx]
-        freqs.append(float(peak_freq))
-    
-    return np.array(freqs)
+        return np.array([0.0], dtype=np.float32)
+
+    # Frame the signal as a zero-copy (n_frames, win) strided view and run
+    # one batched FFT over it, replacing the per-hop Python loop that
+    # re-built the window and frequency bins on every iteration
+    frames = np.lib.stride_tricks.sliding_window_view(y, win)[::hop]
+    # float32 window: never upcasts a float32 signal, and the cache
+    # spares rebuilding it on every call
+    window = _hann(win)
+
+    # Restrict the peak search to [fmin, fmax]; the bins are sorted so a
+    # pair of searchsorted cuts replaces the boolean mask
+    freq_bins = _rfftfreq(win, 1/sr)
+    lo = np.searchsorted(freq_bins, fmin, side='left')
+    hi = np.searchsorted(freq_bins, fmax, side='right')
+    if lo >= hi:
+        return np.zeros(len(frames), dtype=np.float32)
+
+    # Process the frames in blocks: batching the whole file at once
+    # would materialize a windowed copy plus spectra proportional to the
+    # file length (~100 MB for a 10-minute clip), while 512-frame blocks
+    # keep the working set cache-sized without giving up the batched FFT
+    n_frames = len(frames)
+    peaks = np.empty(n_frames, dtype=np.float32)
+    block = 512
+    for start in range(0, n_frames, block):
+        spec = _rfft(frames[start:start + block] * window, axis=-1, **_RFFT_KW)
+        # Squared magnitude, band slice only: argmax is monotonic in the
+        # magnitude so the sqrt inside np.abs would be wasted, and abs
+        # over the out-of-band bins would be thrown away
+        band = spec[:, lo:hi]
+        power = band.real * band.real + band.imag * band.imag
+        peaks[start:start + block] = freq_bins[lo + np.argmax(power, axis=-1)]
+    return peaks
 
 # --- Shape definitions ---
 class Shape:
-    """Class to generate different geometric shapes using Unicode characters"""
+    """Class to generate different geometric shapes using Unicode characters
+
+    The renderers are pure functions of the diameter, so each carries an
+    lru_cache: the ~30 Hz tick then fetches a prebuilt string instead of
+    re-running the O(d^2) rasterization loops.
+    """
     
+    # Band edges in Hz and the shape for each band, low to ultra-high
+    _BINS = (600, 750, 900, 1050, 1150)
+    _SHAPES = ("hexagon", "square", "circle", "triangle", "diamond", "star")
+
     @staticmethod
     def get_shape_for_frequency(freq_hz, diameter=15):
         """Return shape type based on frequency range"""
-        if freq_hz < 600:  # Very low frequencies - hexagon
-            return "hexagon"
-        elif freq_hz < 750:  # Low frequencies - square
-            return "square"
-        elif freq_hz < 900:  # Mid-low frequencies - circle
-            return "circle"
-        elif freq_hz < 1050:  # Mid frequencies - triangle
-            return "triangle"
-        elif freq_hz < 1150:  # High frequencies - diamond
-            return "diamond"
-        else:  # Ultra high frequencies - star
-            return "star"
+        return Shape._SHAPES[bisect.bisect_right(Shape._BINS, freq_hz)]
     
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def render_hexagon(diameter):
         """Render a hexagon shape"""
         d = diameter
@@ -134,56 +184,38 @@ class Shape:
         return "\n".join(lines)
     
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def render_square(diameter):
         """Render a square shape with gradient effect"""
         d = diameter
-        lines = []
         center = d // 2
-        
-        for y in range(d):
-            line = ""
-            for x in range(d):
-                dist_from_center = max(abs(x - center), abs(y - center))
-                dist_from_edge = min(x, y, d - x - 1, d - y - 1)
-                
-                if dist_from_edge == 0:
-                    line += "█"
-                elif dist_from_edge <= 1:
-                    line += "▓"
-                elif dist_from_center <= center // 2:
-                    line += "▒"
-                else:
-                    line += "░"
-            lines.append(line)
-        return "\n".join(lines)
+        yy, xx = np.ogrid[:d, :d]
+        dist_from_center = np.maximum(np.abs(xx - center), np.abs(yy - center))
+        dist_from_edge = np.minimum(np.minimum(xx, yy),
+                                    np.minimum(d - xx - 1, d - yy - 1))
+        glyphs = np.select(
+            [dist_from_edge == 0, dist_from_edge <= 1,
+             dist_from_center <= center // 2],
+            ["█", "▓", "▒"], default="░")
+        return "\n".join("".join(row) for row in glyphs)
     
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def render_circle(diameter):
         """Render a circle shape with smooth gradients"""
         d = diameter
         center = (d - 1) / 2
-        lines = []
-        
-        for y in range(d):
-            line = ""
-            for x in range(d):
-                dist = ((x - center) ** 2 + (y - center) ** 2) ** 0.5
-                radius = center
-                
-                if dist > radius:
-                    line += " "
-                elif dist > radius * 0.8:
-                    line += "░"
-                elif dist > radius * 0.6:
-                    line += "▒"
-                elif dist > radius * 0.3:
-                    line += "▓"
-                else:
-                    line += "█"
-            lines.append(line)
-        return "\n".join(lines)
+        radius = center
+        yy, xx = np.ogrid[:d, :d]
+        dist = np.hypot(xx - center, yy - center)
+        glyphs = np.select(
+            [dist > radius, dist > radius * 0.8,
+             dist > radius * 0.6, dist > radius * 0.3],
+            [" ", "░", "▒", "▓"], default="█")
+        return "\n".join("".join(row) for row in glyphs)
     
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def render_triangle(diameter):
         """Render an upward pointing triangle"""
         d = diameter
@@ -219,117 +251,110 @@ class Shape:
         return "\n".join(lines)
     
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def render_diamond(diameter):
         """Render a diamond shape"""
         d = diameter
-        lines = []
         center = d // 2
-        
-        for y in range(d):
-            line = ""
-            # Diamond calculation
-            if y <= center:
-                width = y * 2
-            else:
-                width = (d - y - 1) * 2
-            
-            start = center - width // 2
-            end = center + width // 2
-            
-            for x in range(d):
-                if start <= x <= end:
-                    dist_from_center = abs(x - center)
-                    if x == start or x == end:
-                        line += "█"
-                    elif dist_from_center <= 1:
-                        line += "▓"
-                    elif dist_from_center <= width // 4:
-                        line += "▒"
-                    else:
-                        line += "░"
-                else:
-                    line += " "
-            lines.append(line)
-        return "\n".join(lines)
+        yy, xx = np.ogrid[:d, :d]
+        # Row width grows to the middle, then shrinks symmetrically
+        width = np.where(yy <= center, yy * 2, (d - yy - 1) * 2)
+        start = center - width // 2
+        end = center + width // 2
+        dist_from_center = np.abs(xx - center)
+        glyphs = np.select(
+            [(xx < start) | (xx > end), (xx == start) | (xx == end),
+             dist_from_center <= 1, dist_from_center <= width // 4],
+            [" ", "█", "▓", "▒"], default="░")
+        return "\n".join("".join(row) for row in glyphs)
     
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def render_star(diameter):
         """Render a star shape"""
         d = diameter
-        lines = []
         center = d // 2
-        
-        for y in range(d):
-            line = ""
-            for x in range(d):
-                dx = x - center
-                dy = y - center
-                dist = (dx * dx + dy * dy) ** 0.5
-                
-                # Create star pattern using angle calculations
-                if dist == 0:
-                    line += "█"
-                else:
-                    angle = np.arctan2(dy, dx)
-                    # Create 5-pointed star
-                    star_radius = center * (0.7 + 0.3 * np.cos(5 * angle))
-                    
-                    if dist <= star_radius * 0.3:
-                        line += "█"
-                    elif dist <= star_radius * 0.6:
-                        line += "▓"
-                    elif dist <= star_radius * 0.9:
-                        line += "▒"
-                    elif dist <= star_radius:
-                        line += "░"
-                    else:
-                        line += " "
-            lines.append(line)
-        return "\n".join(lines)
+        yy, xx = np.ogrid[:d, :d]
+        dx = xx - center
+        dy = yy - center
+        dist = np.hypot(dx, dy)
+        # 5-pointed star: the rim radius oscillates with the angle
+        angle = np.arctan2(dy, dx)
+        star_radius = center * (0.7 + 0.3 * np.cos(5 * angle))
+        glyphs = np.select(
+            [dist == 0, dist <= star_radius * 0.3, dist <= star_radius * 0.6,
+             dist <= star_radius * 0.9, dist <= star_radius],
+            ["█", "█", "▓", "▒", "░"], default=" ")
+        return "\n".join("".join(row) for row in glyphs)
+
+# shape_type -> renderer, one dict probe per render instead of the
+# if/elif chain
+_RENDERERS = {
+    "hexagon": Shape.render_hexagon,
+    "square": Shape.render_square,
+    "circle": Shape.render_circle,
+    "triangle": Shape.render_triangle,
+    "diamond": Shape.render_diamond,
+    "star": Shape.render_star,
+}
 
 # --- Color mapping ---
+def _interp(x, lo, hi, a, b):
+    """Scalar np.interp: linear between (lo, a) and (hi, b), clamped."""
+    if x <= lo: return a
+    if x >= hi: return b
+    return a + (b - a) * (x - lo) / (hi - lo)
+
 def hz_to_hex_color(hz, hz_min=30, hz_max=6000, s=0.9, v=0.95):
     """Map frequency (Hz) to a hex color string with enhanced color variety based on shape."""
+    # Quantize to whole Hz: indistinguishable on screen, and the per-tick
+    # log/trig/HSV math collapses to a cache probe after warm-up
+    return _hz_color_cached(int(hz), hz_min, hz_max, s, v)
+
+@functools.lru_cache(maxsize=8192)
+def _hz_color_cached(hz, hz_min, hz_max, s, v):
     if hz <= 0: return "#404040"
     
     # Get shape type for this frequency
     shape_type = Shape.get_shape_for_frequency(hz)
     
-    log_hz = np.log2(max(1e-6, hz))
-    log_min = np.log2(max(1e-6, hz_min))
-    log_max = np.log2(max(1e-6, hz_max))
+    # Stdlib scalar math throughout: the NumPy ufuncs each paid dispatch
+    # and boxing overhead for a single float
+    log_hz = math.log2(max(1e-6, hz))
+    log_min = math.log2(max(1e-6, hz_min))
+    log_max = math.log2(max(1e-6, hz_max))
     
     # Shape-specific color schemes
     if shape_type == "hexagon":
         # Very low frequencies: deep earth tones (brown, dark orange)
-        hue = np.interp(log_hz, [log_min, log_max], [0.08, 0.12])  # Brown to dark orange
-        saturation = 0.8 + 0.2 * np.sin(hz / 30)  # Subtle variation
-        value = 0.7 + 0.2 * np.cos(hz / 40)  # Darker tones
+        hue = _interp(log_hz, log_min, log_max, 0.08, 0.12)  # Brown to dark orange
+        saturation = 0.8 + 0.2 * math.sin(hz / 30)  # Subtle variation
+        value = 0.7 + 0.2 * math.cos(hz / 40)  # Darker tones
     elif shape_type == "square":
         # Low frequencies: warm colors (reds, oranges, yellows)
-        hue = np.interp(log_hz, [log_min, log_max], [0.0, 0.15])  # Red to orange
-        saturation = 0.8 + 0.2 * np.sin(hz / 50)  # Subtle variation
+        hue = _interp(log_hz, log_min, log_max, 0.0, 0.15)  # Red to orange
+        saturation = 0.8 + 0.2 * math.sin(hz / 50)  # Subtle variation
         value = 0.9
     elif shape_type == "circle":
         # Mid frequencies: cool colors (greens, cyans)
-        hue = np.interp(log_hz, [log_min, log_max], [0.25, 0.55])  # Green to cyan
-        saturation = 0.7 + 0.3 * np.cos(hz / 200)  # Oscillating saturation
+        hue = _interp(log_hz, log_min, log_max, 0.25, 0.55)  # Green to cyan
+        saturation = 0.7 + 0.3 * math.cos(hz / 200)  # Oscillating saturation
         value = 0.85
     elif shape_type == "triangle":
         # High frequencies: blue to purple spectrum
-        hue = np.interp(log_hz, [log_min, log_max], [0.6, 0.8])  # Blue to purple
+        hue = _interp(log_hz, log_min, log_max, 0.6, 0.8)  # Blue to purple
         saturation = 0.9
-        value = 0.95 - 0.1 * np.sin(hz / 500)  # Varying brightness
+        value = 0.95 - 0.1 * math.sin(hz / 500)  # Varying brightness
     elif shape_type == "diamond":
         # Very high frequencies: purple to magenta spectrum
-        hue = np.interp(log_hz, [log_min, log_max], [0.8, 0.95])  # Purple to magenta
+        hue = _interp(log_hz, log_min, log_max, 0.8, 0.95)  # Purple to magenta
         saturation = 1.0
-        value = 0.9 + 0.1 * np.cos(hz / 1000)  # Bright with variation
+        value = 0.9 + 0.1 * math.cos(hz / 1000)  # Bright with variation
     else:  # star
         # Ultra high frequencies: bright rainbow spectrum
         hue = (hz % 2000) / 2000.0  # Full rainbow cycle
-        saturation = 0.95 + 0.05 * np.sin(hz / 1500)  # Very saturated
-        value = 0.95 + 0.05 * np.cos(hz / 2000)  # Very bright
+        saturation = 0.95 + 0.05 * math.sin(hz / 1500)  # Very saturated
+        value = 0.95 + 0.05 * math.cos(hz / 2000)  # Very bright
     
     # Clamp values
     saturation = max(0.3, min(1.0, saturation))
@@ -342,6 +367,10 @@ def hz_to_hex_color(hz, hz_min=30, hz_max=6000, s=0.9, v=0.95):
 # --- Audio Player ---
 class AudioPlayer:
     def __init__(self):
+        # Deferred import: SDL/mixer setup is only paid for by players,
+        # not by anyone merely importing this module
+        global pygame
+        import pygame
         pygame.mixer.init()
         self.current_file = None
         self.is_playing = False
@@ -384,6 +413,9 @@ class FileNameLabel(Static):
 # --- Native file dialog function ---
 def show_file_dialog():
     """Show native file dialog and return selected file path."""
+    import tkinter as tk
+    from tkinter import filedialog
+
     # Create a root window but hide it
     root = tk.Tk()
     root.withdraw()
@@ -408,45 +440,59 @@ def show_file_dialog():
 
 class Ball(Static):
     freq_hz = reactive(0.0)
-    color = reactive("#808080")
     diameter = reactive(15)
-    shape_type = reactive("circle")
+    # Plain attributes, managed by watch_freq_hz: making these reactive
+    # too meant every tick queued three refreshes (shape, color, and the
+    # explicit one) for a single frame of change
+    color = "#808080"
+    shape_type = "circle"
 
     def render(self):
-        # Get shape type based on current frequency
-        self.shape_type = Shape.get_shape_for_frequency(self.freq_hz, self.diameter)
-        
+        # shape_type was already set by watch_freq_hz before the refresh
+        # that got us here; recomputing it would also re-assign the
+        # reactive and risk a second render
+
         # Create frequency info display
         freq_info = f"\n{self.freq_hz:.1f} Hz - {self.shape_type.upper()}\n"
         
-        # Render the appropriate shape
-        if self.shape_type == "hexagon":
-            shape_render = Shape.render_hexagon(self.diameter)
-        elif self.shape_type == "square":
-            shape_render = Shape.render_square(self.diameter)
-        elif self.shape_type == "triangle":
-            shape_render = Shape.render_triangle(self.diameter)
-        elif self.shape_type == "diamond":
-            shape_render = Shape.render_diamond(self.diameter)
-        elif self.shape_type == "star":
-            shape_render = Shape.render_star(self.diameter)
-        else:  # default to circle
-            shape_render = Shape.render_circle(self.diameter)
-            
-        return freq_info + shape_render + freq_info
+        # Render the appropriate shape (unknown types fall back to circle)
+        renderer = _RENDERERS.get(self.shape_type, Shape.render_circle)
+        return freq_info + renderer(self.diameter) + freq_info
+
+    # Optional precomputed hue table: hz_to_hex_color runs pure-Python
+    # colorsys math per frame, so an app driving the ball at frame rate
+    # can install a LUT and pay one list index instead
+    _color_lut = None
+    _lut_fmin = 30.0
+    _lut_fmax = 6000.0
+
+    def set_color_lut(self, lut, fmin, fmax):
+        """Install a precomputed hex-color table indexed by frequency."""
+        self._color_lut = lut
+        self._lut_fmin = fmin
+        self._lut_fmax = fmax
+
+    def _color_for(self, f):
+        if f <= 0:
+            return "#404040"  # silent/unvoiced frames stay neutral gray
+        lut = self._color_lut
+        if lut is None:
+            return hz_to_hex_color(f)
+        span = self._lut_fmax - self._lut_fmin
+        idx = int((f - self._lut_fmin) / span * (len(lut) - 1)) if span > 0 else 0
+        return lut[min(max(idx, 0), len(lut) - 1)]
 
-    def watch_color(self, c): self.styles.color = c
-    def watch_freq_hz(self, f): 
+    def watch_freq_hz(self, f):
         # Update shape type based on frequency
         self.shape_type = Shape.get_shape_for_frequency(f)
         # Update color based on frequency
-        self.color = hz_to_hex_color(f)
+        self.color = self._color_for(f)
+        self.styles.color = self.color
         # Update border title
         self.border_title = f"{f:7.1f} Hz ({self.shape_type})" if f > 0 else ""
-        # Refresh to update both shape and color
+        # Single refresh covering shape, color and title
         self.refresh()
     def watch_diameter(self, d): self.refresh()
-    def watch_shape_type(self, s): self.refresh()
 
 class FreqLabel(Static):
     freq_hz = reactive(0.0)
@@ -493,11 +539,30 @@ class FreqBallApp(App):
 
     def update_freq_stats(self):
         if len(self.freqs) > 0 and np.any(self.freqs > 0):
-            self.hz_min = max(30.0, np.percentile(self.freqs[self.freqs>0], 5))
-            self.hz_max = max(self.hz_min+1, np.percentile(self.freqs, 95))
+            # Order statistics via np.partition: O(N) selection instead
+            # of the full sort inside np.percentile — the range only
+            # normalizes the display, so interpolation is not needed
+            pos = self.freqs[self.freqs > 0]
+            k5 = min(len(pos) - 1, max(0, int(0.05 * len(pos))))
+            k95 = min(len(self.freqs) - 1, int(0.95 * len(self.freqs)))
+            self.hz_min = max(30.0, float(np.partition(pos, k5)[k5]))
+            self.hz_max = max(self.hz_min + 1, float(np.partition(self.freqs, k95)[k95]))
         else:
             self.hz_min = 30.0
             self.hz_max = 6000.0
+        # Native floats for the tick loop: list indexing skips the NumPy
+        # scalar boxing that float(ndarray[i]) pays 30 times a second
+        self._freqs_list = np.asarray(self.freqs).tolist()
+        # The ball's circular motion is a pure function of (f, hz_min,
+        # hz_max), so bake the whole series into two int8 offset tables
+        # here and let _tick index them instead of running trig per frame
+        if len(self.freqs) > 0 and self.hz_max > self.hz_min:
+            fn = np.clip((self.freqs - self.hz_min) / (self.hz_max - self.hz_min), 0, 1)
+            ang = fn * (2 * math.pi)
+            self._xoff = (2 * np.cos(ang)).astype(np.int8)
+            self._yoff = (2 * np.sin(ang)).astype(np.int8)
+        else:
+            self._xoff = self._yoff = None
 
     def compose(self) -> ComposeResult:
         self.ball = Ball()
@@ -583,21 +648,14 @@ class FreqBallApp(App):
     def _tick(self):
         if self._paused or not len(self.freqs):
             return
-        f = float(self.freqs[self._i])
+        f = self._freqs_list[self._i]
         self.ball.freq_hz = f  # This will automatically update color and shape via watch_freq_hz
         self.label.freq_hz = f
 
-        # Create small multi-directional movement based on frequency
-        if self.hz_max > self.hz_min:
-            # Normalize frequency to [0, 1] range
-            freq_normalized = (f - self.hz_min) / (self.hz_max - self.hz_min)
-            # Use frequency to create circular motion with small radius (1-2 characters)
-            import math
-            angle = freq_normalized * 2 * math.pi  # Full circle based on frequency
-            radius = 2  # Small movement radius (about 1mm equivalent in terminal)
-            x_offset = int(radius * math.cos(angle))
-            y_offset = int(radius * math.sin(angle))
-            self.ball.styles.offset = (x_offset, y_offset)
+        # Small multi-directional movement: offsets were precomputed for
+        # the whole series in update_freq_stats
+        if self._xoff is not None:
+            self.ball.styles.offset = (int(self._xoff[self._i]), int(self._yoff[self._i]))
         else:
             self.ball.styles.offset = (0, 0)
 